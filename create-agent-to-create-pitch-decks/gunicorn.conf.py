@@ -0,0 +1,34 @@
+"""
+Gunicorn settings for the pitch deck API.
+Picked up automatically when gunicorn is started from this directory:
+
+    gunicorn pitch_deck_agent:app
+"""
+
+# Patch before the app (requests, ssl) is imported by the preloading master,
+# otherwise gevent has to patch modules that are already in use.
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Cooperative workers: scraping and Gemini calls are socket I/O, so a
+# gevent worker can serve many requests while others wait on the network.
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 2) * 2 + 1))
+worker_connections = 500
+timeout = 60
+
+# Import the app once in the master; workers inherit it copy-on-write.
+# Module import opens no sockets (Gemini client and HTTP pools are lazy).
+preload_app = True
+
+
+def post_fork(server, worker):
+    # The master touched the caches while importing the app; give each worker
+    # its own SQLite connection instead of sharing the inherited one.
+    import pitch_deck_agent
+    pitch_deck_agent.cache.close()
+    pitch_deck_agent.throttle_cache.close()
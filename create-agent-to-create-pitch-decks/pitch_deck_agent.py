@@ -5,69 +5,268 @@ Fully self-hosted, free API for your Vercel frontend:
 https://ai-fundraising-support.vercel.app
 """
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+import orjson
 import os
 import io
+import re
+import hashlib
+import functools
+import time
+import uuid
 import requests
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import diskcache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+try:
+    from selectolax.parser import HTMLParser  # C parser, much faster than bs4
+except ImportError:
+    HTMLParser = None
 import google.generativeai as genai
+from google.api_core.exceptions import TooManyRequests
 from fpdf import FPDF
-from presenton_core.app import presenton_app, generate_presentation as local_generate
+from presenton_core.app import presenton_app, _generate_presentation_impl as local_generate
 
 # ---------------- FLASK APP ---------------- #
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify() / request.get_json() through orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str decode
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype="application/json")
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app, origins=["https://ai-fundraising-support.vercel.app"])
 
+# Deck payloads are several KB of markdown; compress anything non-trivial
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
+
 # Register local Presenton simulation
 app.register_blueprint(presenton_app)
 
 # ---------------- CONFIG ---------------- #
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# REST goes through plain sockets, which gevent workers can yield on (gRPC can't)
+GEMINI_TRANSPORT = os.getenv("GEMINI_TRANSPORT", "rest")
 
 if not GEMINI_API_KEY:
     raise ValueError("❌ GEMINI_API_KEY not set!")
 
-genai.configure(api_key=GEMINI_API_KEY)
-model = genai.GenerativeModel(GEMINI_MODEL)
-
-# ---------------- GLOBAL MEMORY ---------------- #
-last_generated_structure = None
-last_company_info = None
+@functools.lru_cache(maxsize=1)
+def get_model():
+    """Configure Gemini and build the model once, on first use"""
+    genai.configure(api_key=GEMINI_API_KEY, transport=GEMINI_TRANSPORT)
+    return genai.GenerativeModel(GEMINI_MODEL)
+
+# ---------------- CACHE ---------------- #
+# Shared on disk so every worker process sees the same entries
+CACHE_DIR = os.getenv("CACHE_DIR", "/tmp/pitch-deck-cache")
+DECK_CACHE_TTL = int(os.getenv("DECK_CACHE_TTL", 24 * 3600))
+cache = diskcache.Cache(CACHE_DIR)
+
+def _digest(*fields):
+    """Stable sha256 over text fields, used for every content cache key"""
+    return hashlib.sha256("\x1f".join(fields).encode("utf-8")).hexdigest()
+
+# ---------------- HTTP SESSION ---------------- #
+# One pooled session keeps connections alive across scrapes
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# <title> and meta description live in <head>, well inside this budget
+MAX_HTML_BYTES = 64 * 1024
+
+# ---------------- BACKGROUND WORK ---------------- #
+# Runs independent I/O (Gemini, Presenton) side by side within a request
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# ---------------- GENERATED DECKS ---------------- #
+# Kept in the shared cache (not process globals) so the download can land
+# on any worker, not just the one that served /generate.
+DECK_STORE_TTL = int(os.getenv("DECK_STORE_TTL", 3600))
+DOWNLOAD_URL = "https://pitch-deck-ai.onrender.com/downloads/latest.pdf"
+
+def save_generated_deck(deck_id, structure, company_info):
+    """Remember a generated deck for later download"""
+    record = {"structure": structure, "company_info": company_info}
+    cache.set(("generated", deck_id), record, expire=DECK_STORE_TTL)
+    # Clients that still hit the bare URL get the most recent deck
+    cache.set(("generated-latest",), deck_id, expire=DECK_STORE_TTL)
+
+def load_generated_deck(deck_id=None):
+    """Fetch a generated deck by id (or the most recent one)"""
+    deck_id = deck_id or cache.get(("generated-latest",))
+    if not deck_id:
+        return None
+    deck = cache.get(("generated", deck_id))
+    return deck if isinstance(deck, dict) else None
 
 # ---------------- SCRAPER ---------------- #
-def fetch_company_info(url: str):
-    """Extract company info from a given URL"""
-    try:
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+# Titles served by bot walls and error pages rather than the company site
+BAD_TITLES = frozenset({
+    "untitled",
+    "just a moment...",
+    "just a moment…",
+    "access denied",
+    "attention required! | cloudflare",
+    "403 forbidden",
+    "404 not found",
+    "page not found",
+    "not found",
+    "error",
+})
+MIN_DESCRIPTION_CHARS = 40
+
+def parse_company_page(html: bytes):
+    """Pull (title, description) out of raw HTML"""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+
+        def first(selector, attr=None):
+            node = tree.css_first(selector)
+            if node is None:
+                return ""
+            return (node.attributes.get(attr) if attr else node.text(strip=True)) or ""
+
+        title = first("title") or first("h1")
+        description = (
+            first('meta[name="description"]', "content")
+            or first('meta[property="og:description"]', "content")
+        )
+    else:
+        soup = BeautifulSoup(html, "lxml")
 
-        headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        def first(name, attrs=None, attr=None):
+            node = soup.find(name, attrs or {})
+            if node is None:
+                return ""
+            return (node.get(attr) if attr else node.get_text(strip=True)) or ""
 
-        soup = BeautifulSoup(response.content, "html.parser")
-        title = soup.title.string if soup.title else "Untitled"
+        title = first("title") or first("h1")
         description = (
-            (soup.find("meta", {"name": "description"}) or {}).get("content", "")
+            first("meta", {"name": "description"}, "content")
+            or first("meta", {"property": "og:description"}, "content")
         )
+    return title or "Untitled", description
+
+def is_low_value_page(company_info):
+    """True for error/bot-wall pages that would only waste a Gemini call"""
+    title = (company_info.get("title") or "").strip().lower()
+    description = (company_info.get("description") or "").strip()
+    return title in BAD_TITLES and len(description) < MIN_DESCRIPTION_CHARS
+
+# Scrapes are revalidated with ETag / Last-Modified; cap how long we trust them
+SCRAPE_CACHE_TTL = int(os.getenv("SCRAPE_CACHE_TTL", 24 * 3600))
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+def normalize_url(url):
+    """Lowercase scheme/host and drop the fragment and tracking params"""
+    parts = urlsplit(url)
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAMS)
+    ])
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""
+    ))
+
+def fetch_company_info(url: str):
+    """Extract company info from a given URL"""
+    try:
+        if not url.lower().startswith(("http://", "https://")):
+            url = "https://" + url
+        # The normalized URL is what gets fetched, returned and fed into the
+        # deck cache key, so tagged links share cache entries with clean ones
+        url = normalize_url(url)
+
+        key = ("scrape", url)
+        cached = cache.get(key)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with SESSION.get(url, headers=headers, timeout=10, stream=True) as response:
+            if cached and response.status_code == 304:
+                print(f"⚡ {url} not modified, using cached scrape.")
+                return cached["info"]
+
+            response.raise_for_status()
+            html = response.raw.read(MAX_HTML_BYTES, decode_content=True)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        title, description = parse_company_page(html)
+        info = {"url": url, "title": title, "description": description}
+
+        if etag or last_modified:
+            cache.set(key, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "info": info
+            }, expire=SCRAPE_CACHE_TTL)
 
         print(f"✅ Scraped {url}: {title}")
-        return {"url": url, "title": title, "description": description}
+        return info
 
     except Exception as e:
         print(f"❌ Error fetching info: {str(e)}")
         return {"error": str(e)}
 
 # ---------------- GEMINI STRUCTURE ---------------- #
-def generate_pitch_deck(company_info):
-    """Generate a 10-slide pitch deck in Markdown"""
-    prompt = f"""
-Create a 10-slide investor pitch deck in Markdown for:
-Company: {company_info.get('title')}
-Website: {company_info.get('url')}
-Description: {company_info.get('description')}
+# Stay at ~80% of the free tier's 30 requests/min. The token bucket lives on
+# disk, so all workers draw from the same budget. It gets its own cache with
+# eviction off: throttle() breaks if its key is ever culled.
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", 24))
+GEMINI_MAX_RETRIES = int(os.getenv("GEMINI_MAX_RETRIES", 3))
+throttle_cache = diskcache.Cache(os.path.join(CACHE_DIR, "throttle"), eviction_policy="none")
+
+@diskcache.throttle(throttle_cache, GEMINI_RPM, 60, name="gemini-rpm")
+def _throttled_generate(prompt, **kwargs):
+    return get_model().generate_content(prompt, **kwargs)
+
+def call_gemini(prompt, **kwargs):
+    """Rate-limited Gemini call that backs off when quota is exhausted"""
+    for attempt in range(GEMINI_MAX_RETRIES + 1):
+        try:
+            return _throttled_generate(prompt, **kwargs)
+        except TooManyRequests:  # 429 / RESOURCE_EXHAUSTED
+            if attempt == GEMINI_MAX_RETRIES:
+                raise
+            delay = min(2 ** (attempt + 1), 30)
+            print(f"⏳ Gemini rate limited, retrying in {delay}s...")
+            time.sleep(delay)
+
+# Static instructions first, company fields last: every request shares the
+# same prompt prefix, which is what Gemini's implicit prefix caching keys on.
+PROMPT_PREFIX = """Create a 10-slide investor pitch deck in Markdown for the company below.
 
 Slides:
 1. Title Slide
@@ -83,20 +282,187 @@ Slides:
 
 Keep it concise, professional, and logically structured.
 """
+
+def build_prompt(company_info):
+    """Append the company-specific fields to the fixed prompt prefix"""
+    return (
+        f"{PROMPT_PREFIX}\n"
+        f"Company: {company_info.get('title')}\n"
+        f"Website: {company_info.get('url')}\n"
+        f"Description: {company_info.get('description')}\n"
+    )
+
+def deck_cache_key(company_info):
+    """Exact-match cache key for the company fields fed into the prompt"""
+    return ("deck", _digest(
+        company_info.get("title") or "",
+        company_info.get("url") or "",
+        company_info.get("description") or "",
+    ))
+
+def cached_deck(company_info):
+    """Look up a previously generated deck; returns (cache_key, structure or None)"""
+    key = deck_cache_key(company_info)
+    structure = cache.get(key)
+    if structure is not None:
+        print("⚡ Gemini deck structure served from cache.")
+    return key, structure
+
+def generate_pitch_deck(company_info):
+    """Generate a 10-slide pitch deck in Markdown; raises if Gemini fails"""
+    key, cached = cached_deck(company_info)
+    if cached is not None:
+        return cached
+
+    response = call_gemini(build_prompt(company_info))
+    structure = response.text.strip()
+    print("✅ Gemini deck structure generated successfully.")
+    cache.set(key, structure, expire=DECK_CACHE_TTL)
+    return structure
+
+def stream_pitch_deck(company_info):
+    """Yield the deck Markdown piece by piece as Gemini writes it"""
+    key, cached = cached_deck(company_info)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    for chunk in call_gemini(build_prompt(company_info), stream=True):
+        parts.append(chunk.text)
+        yield chunk.text
+
+    print("✅ Gemini deck structure streamed successfully.")
+    cache.set(key, "".join(parts).strip(), expire=DECK_CACHE_TTL)
+
+# ---------------- MAIN API ---------------- #
+def scrape_for_deck(company_url):
+    """Scrape a company URL; returns (company_info, None) or (None, (payload, http_status))"""
+    print(f"🚀 Generating pitch deck for {company_url}")
+    company_info = fetch_company_info(company_url)
+    if "error" in company_info:
+        return None, ({"error": company_info["error"]}, 400)
+
+    if is_low_value_page(company_info):
+        print(f"⚠️ Skipping Gemini, no usable content at {company_info['url']}")
+        return None, ({
+            "error": "Could not read company details from this URL "
+                     "(blocked, empty or error page). Try the homepage or another URL."
+        }, 422)
+
+    return company_info, None
+
+def finish_deck(structure, company_info, presentation):
+    """Store a generated deck and build the API response for it"""
+    deck_id = presentation["presentation_id"]
+    save_generated_deck(deck_id, structure, company_info)
+
+    return {
+        "success": True,
+        "company_info": company_info,
+        "deck_structure": structure,
+        "download_url": f"{DOWNLOAD_URL}?id={deck_id}",
+        "edit_url": presentation.get("edit_path")
+    }
+
+def build_deck(company_url):
+    """Scrape, generate and store a deck; returns (payload, http_status)"""
+    company_info, error = scrape_for_deck(company_url)
+    if error:
+        return error
+
+    # Gemini runs in the background while Presenton reserves the deck;
+    # the local simulation only allocates ids and never reads content.
+    deck_future = EXECUTOR.submit(generate_pitch_deck, company_info)
+
+    print("🎨 Using internal Presenton simulation...")
+    result = local_generate(n_slides=10, export_as="pdf")
+
     try:
-        response = model.generate_content(prompt)
-        print("✅ Gemini deck structure generated successfully.")
-        return response.text.strip()
+        structure = deck_future.result()
     except Exception as e:
+        # Nothing is stored, so a failed generation never becomes "latest"
         print(f"❌ Gemini Error: {str(e)}")
-        return f"# Error generating structure: {str(e)}"
+        return {"error": f"Error generating structure: {str(e)}"}, 502
+
+    return finish_deck(structure, company_info, result), 200
 
-# ---------------- MAIN API ---------------- #
 @app.route("/generate", methods=["POST"])
 def generate_api():
     """Frontend endpoint to generate pitch decks"""
-    global last_generated_structure, last_company_info
+    try:
+        data = request.get_json(force=True)
+        company_url = data.get("url")
+
+        if not company_url:
+            return jsonify({"error": "Missing 'url' field"}), 400
+
+        payload, status = build_deck(company_url)
+        return jsonify(payload), status
+
+    except Exception as e:
+        print(f"❌ API Error: {str(e)}")
+        return jsonify({"error": str(e)}), 500
 
+def sse_event(event, data):
+    """Format one Server-Sent Events message with a JSON payload"""
+    return f"event: {event}\ndata: {app.json.dumps(data)}\n\n"
+
+@app.route("/generate/stream", methods=["GET", "POST"])
+def generate_stream_api():
+    """Stream the deck as Server-Sent Events while Gemini generates it"""
+    company_url = request.args.get("url") or (request.get_json(silent=True) or {}).get("url")
+    if not company_url:
+        return jsonify({"error": "Missing 'url' field"}), 400
+
+    company_info, error = scrape_for_deck(company_url)
+    if error:
+        payload, status = error
+        return jsonify(payload), status
+
+    def events():
+        try:
+            parts = []
+            for text in stream_pitch_deck(company_info):
+                parts.append(text)
+                yield sse_event("chunk", {"text": text})
+
+            result = local_generate(n_slides=10, export_as="pdf")
+            yield sse_event("done", finish_deck("".join(parts).strip(), company_info, result))
+
+        except Exception as e:
+            print(f"❌ Stream Error: {str(e)}")
+            yield sse_event("error", {"error": str(e)})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# ---------------- BACKGROUND JOBS ---------------- #
+# Job state lives in the shared cache so /status works from any worker
+JOB_TTL = int(os.getenv("JOB_TTL", 3600))
+# Separate pool: jobs wait on EXECUTOR themselves and must not starve it
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("JOB_WORKERS", 4)))
+
+def run_deck_job(job_id, company_url):
+    """Build a deck in the background and record the outcome"""
+    try:
+        payload, status = build_deck(company_url)
+    except Exception as e:
+        print(f"❌ Job {job_id} failed: {str(e)}")
+        payload, status = {"error": str(e)}, 500
+
+    cache.set(("job", job_id), {
+        "state": "SUCCESS" if status == 200 else "FAILURE",
+        "status_code": status,
+        "result": payload
+    }, expire=JOB_TTL)
+
+@app.route("/generate/async", methods=["POST"])
+def generate_async_api():
+    """Queue a pitch deck build and return a job id to poll"""
     try:
         data = request.get_json(force=True)
         company_url = data.get("url")
@@ -104,80 +470,120 @@ def generate_api():
         if not company_url:
             return jsonify({"error": "Missing 'url' field"}), 400
 
-        print(f"🚀 Generating pitch deck for {company_url}")
-        company_info = fetch_company_info(company_url)
-        if "error" in company_info:
-            return jsonify({"error": company_info["error"]}), 400
-
-        structure = generate_pitch_deck(company_info)
-
-        print("🎨 Using internal Presenton simulation...")
-        with app.test_request_context(json={
-            "content": structure,
-            "n_slides": 10,
-            "export_as": "pdf"
-        }):
-            result = local_generate().get_json()
-
-        # Save the latest generated output
-        last_generated_structure = structure
-        last_company_info = company_info
-
-        return jsonify({
-            "success": True,
-            "company_info": company_info,
-            "deck_structure": structure,
-            "download_url": "https://pitch-deck-ai.onrender.com/downloads/latest.pdf",
-            "edit_url": result.get("edit_path")
-        })
+        job_id = uuid.uuid4().hex
+        cache.set(("job", job_id), {"state": "PENDING"}, expire=JOB_TTL)
+        JOB_EXECUTOR.submit(run_deck_job, job_id, company_url)
+
+        return jsonify({"job_id": job_id, "status_url": f"/status/{job_id}"}), 202
 
     except Exception as e:
         print(f"❌ API Error: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+@app.route("/status/<job_id>", methods=["GET"])
+def job_status(job_id):
+    """Report the state (and result once finished) of a queued build"""
+    job = cache.get(("job", job_id))
+    if job is None:
+        return jsonify({"error": "Unknown or expired job id"}), 404
+    return jsonify({"job_id": job_id, **job})
+
 # ---------------- PDF GENERATOR ---------------- #
+# A Markdown ATX heading: up to 3 spaces of indent, 1-6 hashes, whitespace,
+# then a non-blank title. Each one starts a slide that runs to the next.
+SLIDE_HEADING_RE = re.compile(
+    r"^[ ]{0,3}#{1,6}[ \t]+(?P<title>\S[^\n]*?)(?:[ \t]+#+)?[ \t]*$",
+    re.MULTILINE,
+)
+# Fallback for decks without headings (e.g. "**Slide 1: ...**" style)
+SLIDE_BREAK_RE = re.compile(r"\n[ \t]*\n|^[ \t]*-{3,}[ \t]*$", re.MULTILINE)
+
+def split_slides(structure):
+    """Split deck markdown into (title, body) pairs"""
+    headings = list(SLIDE_HEADING_RE.finditer(structure))
+
+    if not headings:
+        # One slide per blank-line or '---' separated block, first line as title
+        slides = []
+        for block in SLIDE_BREAK_RE.split(structure):
+            block = block.strip()
+            if block:
+                title, _, body = block.partition("\n")
+                slides.append((title.strip("#* "), body.strip()))
+        return slides
+
+    # Slice between heading starts so no text can fall between matches;
+    # anything before the first heading becomes an untitled slide
+    slides = []
+    preamble = structure[:headings[0].start()].strip()
+    if preamble:
+        slides.append(("", preamble))
+    ends = [m.start() for m in headings[1:]] + [len(structure)]
+    for m, end in zip(headings, ends):
+        slides.append((m["title"], structure[m.end():end].strip()))
+    return slides
+
+def pdf_cache_key(structure, company_info):
+    """Cache key covering everything build_pdf renders (cover + slides)"""
+    return ("pdf", _digest(
+        company_info.get("title") or "",
+        company_info.get("url") or "",
+        company_info.get("description") or "",
+        structure,
+    ))
+
+def build_pdf(structure, company_info):
+    """Render the deck markdown into PDF bytes"""
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+
+    # ----------- Cover Slide ----------- #
+    pdf.add_page()
+    pdf.set_font("helvetica", "B", 22)
+    pdf.cell(0, 60, f"Pitch Deck for {company_info.get('title')}", new_x="LMARGIN", new_y="NEXT", align="C")
+    pdf.set_font("helvetica", "", 14)
+    pdf.multi_cell(0, 10, f"Website: {company_info.get('url')}\n\n{company_info.get('description', '')}", new_x="LMARGIN", new_y="NEXT", align="C")
+
+    # ----------- Slides ----------- #
+    slides = split_slides(structure)
+    total_slides = len(slides)
+
+    for i, (title, body) in enumerate(slides, start=1):
+        pdf.add_page()
+        pdf.set_font("helvetica", "B", 16)
+        pdf.cell(0, 10, title, new_x="LMARGIN", new_y="NEXT", align="C")
+        pdf.ln(10)
+        pdf.set_font("helvetica", "", 12)
+        for line in body.splitlines():
+            pdf.multi_cell(0, 8, line, new_x="LMARGIN", new_y="NEXT")
+        # Add slide number
+        pdf.set_y(-20)
+        pdf.set_font("helvetica", "I", 10)
+        pdf.cell(0, 10, f"Slide {i}/{total_slides}", align="C")
+
+    # fpdf2 hands back the document buffer directly, no str round trip
+    return bytes(pdf.output())
+
 @app.route("/downloads/latest.pdf", methods=["GET"])
 def download_generated_pdf():
-    """Generate and return a downloadable PDF of the latest AI slides"""
-    global last_generated_structure, last_company_info
-
-    if not last_generated_structure or not last_company_info:
+    """Generate and return a downloadable PDF of the requested (or latest) AI slides"""
+    deck = load_generated_deck(request.args.get("id"))
+    if not deck:
         return jsonify({"error": "No recent presentation found. Generate one first."}), 400
 
     try:
-        pdf = FPDF()
-        pdf.set_auto_page_break(auto=True, margin=15)
+        structure, company_info = deck["structure"], deck["company_info"]
+
+        # Rendering is deterministic, so repeat downloads reuse the bytes
+        key = pdf_cache_key(structure, company_info)
+        pdf_bytes = cache.get(key)
+        if pdf_bytes is None:
+            pdf_bytes = build_pdf(structure, company_info)
+            cache.set(key, pdf_bytes, expire=DECK_CACHE_TTL)
+            print("✅ PDF generated successfully.")
+        else:
+            print("⚡ PDF served from cache.")
 
-        # ----------- Cover Slide ----------- #
-        pdf.add_page()
-        pdf.set_font("Arial", "B", 22)
-        pdf.cell(0, 60, f"Pitch Deck for {last_company_info.get('title')}", ln=True, align="C")
-        pdf.set_font("Arial", "", 14)
-        pdf.multi_cell(0, 10, f"Website: {last_company_info.get('url')}\n\n{last_company_info.get('description', '')}", align="C")
-
-        # ----------- Slides ----------- #
-        slides = [s.strip() for s in last_generated_structure.split("\n\n") if s.strip()]
-        total_slides = len(slides)
-
-        for i, slide in enumerate(slides, start=1):
-            pdf.add_page()
-            lines = slide.split("\n")
-            title = lines[0].strip("# ").strip()
-            pdf.set_font("Arial", "B", 16)
-            pdf.cell(0, 10, title, ln=True, align="C")
-            pdf.ln(10)
-            pdf.set_font("Arial", "", 12)
-            for line in lines[1:]:
-                pdf.multi_cell(0, 8, line)
-            # Add slide number
-            pdf.set_y(-20)
-            pdf.set_font("Arial", "I", 10)
-            pdf.cell(0, 10, f"Slide {i}/{total_slides}", 0, 0, "C")
-
-        # ✅ Output to bytes (FPDF fix)
-        pdf_bytes = pdf.output(dest="S").encode("latin1")
-
-        print("✅ PDF generated successfully.")
         return send_file(
             io.BytesIO(pdf_bytes),
             as_attachment=True,
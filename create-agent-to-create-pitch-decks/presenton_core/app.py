@@ -1,26 +1,35 @@
 from flask import Blueprint, request, jsonify
+import os
 import time
+import uuid
 
 presenton_app = Blueprint("presenton_app", __name__)
 
-@presenton_app.route("/api/v1/ppt/presentation/generate", methods=["POST"])
-def generate_presentation():
-    """Local simulation of Presenton API – no external call, no payment."""
-    data = request.get_json() or {}
-    content = data.get("content", "")
-    n_slides = data.get("n_slides", 10)
-    export_as = data.get("export_as", "pdf")
+# Optional artificial delay (seconds) for demos, e.g. PRESENTON_SIMULATE_DELAY=2
+SIMULATE_DELAY = float(os.getenv("PRESENTON_SIMULATE_DELAY", "0") or 0)
 
+def _generate_presentation_impl(content="", n_slides=10, export_as="pdf") -> dict:
+    """Build the Presenton-style result without going through HTTP."""
     print("🎨 Local Presenton generator called!")
 
-    # Simulate slide creation delay
-    time.sleep(2)
+    # Simulate slide creation delay (off unless requested)
+    if SIMULATE_DELAY:
+        time.sleep(SIMULATE_DELAY)
 
-    fake_id = str(int(time.time()))
-    return jsonify({
+    fake_id = uuid.uuid4().hex
+    return {
         "success": True,
         "presentation_id": fake_id,
         "path": f"/downloads/{fake_id}.{export_as}",
         "edit_path": f"/edit/{fake_id}"
-    })
+    }
 
+@presenton_app.route("/api/v1/ppt/presentation/generate", methods=["POST"])
+def generate_presentation():
+    """Local simulation of Presenton API – no external call, no payment."""
+    data = request.get_json() or {}
+    return jsonify(_generate_presentation_impl(
+        content=data.get("content", ""),
+        n_slides=data.get("n_slides", 10),
+        export_as=data.get("export_as", "pdf"),
+    ))
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("CACHE_DIR", tempfile.mkdtemp())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pitch_deck_agent import split_slides
+
+
+def test_headings_split_slides():
+    deck = "# Title\nAcme\n\nmore\n## Problem\nStuff"
+    assert split_slides(deck) == [("Title", "Acme\n\nmore"), ("Problem", "Stuff")]
+
+
+def test_blank_heading_line_keeps_following_text():
+    deck = "## Slide 1\nProblem text\n# \nLOST PARAGRAPH\n## Slide 2\nok"
+    assert split_slides(deck) == [
+        ("Slide 1", "Problem text\n# \nLOST PARAGRAPH"),
+        ("Slide 2", "ok"),
+    ]
+
+
+def test_hash_words_are_not_headings():
+    deck = "# Problem\n#1 pain point for SMBs\n#fintech #payments"
+    assert split_slides(deck) == [
+        ("Problem", "#1 pain point for SMBs\n#fintech #payments"),
+    ]
+
+
+def test_text_before_first_heading_is_kept():
+    assert split_slides("Intro\n# Title\nAcme") == [("", "Intro"), ("Title", "Acme")]
+
+
+def test_indented_headings_split_slides():
+    deck = "## Slide 1\na\n  ## Slide 2\nb"
+    assert split_slides(deck) == [("Slide 1", "a"), ("Slide 2", "b")]
+
+
+def test_decks_without_headings_split_on_blocks():
+    deck = "**Slide 1: Problem**\nStuff\n\n**Slide 2: Solution**\nFix\n---\nClosing"
+    assert split_slides(deck) == [
+        ("Slide 1: Problem", "Stuff"),
+        ("Slide 2: Solution", "Fix"),
+        ("Closing", ""),
+    ]